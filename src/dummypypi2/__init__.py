@@ -34,19 +34,63 @@ __version__
 
 """
 
-# Import modules
-from .utils import *
-
-# Import sub-packages
-from . import control
-
-# Import functions to make them available at the package level
-from ._config.algo import algo_options, set_algo_options
-from ._config.plot import set_display_options
-
-# Handle dynamic versioning - fall back to unknown if _version.py is not available
-# FIXME: This does not work when using the workflow in GitHub Actions to build the package and upload to PyPI
-try:
-    from ._version import __version__
-except ImportError:
-    __version__ = "unknown"
\ No newline at end of file
+import importlib
+
+# NOTE: 'typing' is not imported at runtime to keep 'import dummypypi2' fast, so 'TYPE_CHECKING' is defined here instead (type checkers treat it as True)
+TYPE_CHECKING = False
+
+# Sub-packages and package-level functions are loaded lazily on first attribute access (PEP 562), so that 'import dummypypi2' does not import NumPy or any of the sub-packages up front
+_submodules = ['control', 'utils', '_config']
+_submod_attrs = {
+    'utils': ['get_signed_angle', 'is_prime', 'divide', 'is_close'],
+    '_config.algo': ['algo_options', 'set_algo_options'],
+    '_config.plot': ['set_display_options'],
+}
+_attr_to_submod = {attr: submod for submod, attrs in _submod_attrs.items() for attr in attrs}
+
+# NOTE: This is kept as a literal list, as static type checkers cannot read a computed '__all__'
+__all__ = [
+    'control',
+    'utils',
+    'get_signed_angle',
+    'is_prime',
+    'divide',
+    'is_close',
+    'algo_options',
+    'set_algo_options',
+    'set_display_options',
+]
+
+# NOTE: Static type checkers (mypy, Pylance) do not understand the lazy loading, so the imports are repeated here
+if TYPE_CHECKING:
+    from typing import Any
+    from . import control, utils, _config
+    from .utils import get_signed_angle, is_prime, divide, is_close
+    from ._config.algo import algo_options, set_algo_options
+    from ._config.plot import set_display_options
+    __version__: str
+
+
+def __getattr__(name: str) -> 'Any':
+    attr: 'Any'
+    if name == '__version__':
+        # Handle dynamic versioning - read the version from the installed package metadata, and fall back to unknown if the package is not installed
+        # NOTE: Importing 'importlib.metadata' takes a few tens of milliseconds, but this is only paid on the first access of '__version__', not on 'import dummypypi2'
+        from importlib.metadata import version, PackageNotFoundError
+        try:
+            attr = version(__name__)
+        except PackageNotFoundError:
+            attr = "unknown"
+    elif name in _submodules:
+        attr = importlib.import_module(f'.{name}', __name__)
+    elif name in _attr_to_submod:
+        attr = getattr(importlib.import_module(f'.{_attr_to_submod[name]}', __name__), name)
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    # Cache the attribute in the module namespace, so '__getattr__' is only hit once per name
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> 'list[str]':
+    return sorted(set(_submodules) | set(_attr_to_submod) | {'__version__'})
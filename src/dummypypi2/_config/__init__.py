@@ -1,12 +1,28 @@
 """This is the module for global configuration of DummyPyPi2. Do not import this module directly, unless you know what you are doing."""
 
+import sys
+import types
+from typing import TYPE_CHECKING
+
 from . import algo
 
-# Export variables by reference to maintain global state
-def __getattr__(name: str) -> float:
-    if name == 'RTOL':
-        return algo.RTOL
-    elif name == 'ATOL':
-        return algo.ATOL
-    else:
-        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
\ No newline at end of file
+# NOTE: Static type checkers do not see the properties of '_ConfigModule' below, so the attributes are declared here
+if TYPE_CHECKING:
+    RTOL: float
+    ATOL: float
+
+
+class _ConfigModule(types.ModuleType):
+    """Module type which exports the current numerical tolerances as read-only attributes"""
+
+    # NOTE: Properties on the module type are found directly by attribute lookup, instead of going through a module-level '__getattr__' fallback
+    @property
+    def RTOL(self) -> float:
+        return algo._get_rtol()
+
+    @property
+    def ATOL(self) -> float:
+        return algo._get_atol()
+
+
+sys.modules[__name__].__class__ = _ConfigModule
\ No newline at end of file
@@ -1,105 +1,38 @@
 from __future__ import annotations
-from typing import Literal, Any
+from contextvars import ContextVar
+from contextlib import contextmanager
+from typing import Literal, Iterator
 
-RTOL: float = 1E-5
-ATOL: float = 1E-8
+# Process-wide tolerance values, set permanently by 'set_algo_options'
+_rtol_default: float = 1E-5
+_atol_default: float = 1E-8
 
-class _NumericalToleranceBase:
-    """Base class with shared numerical tolerance setting functionality"""
-    
-    def _set_tolerance(self, *, rtol: float | None = None, atol: float | None = None) -> None:
-        """Set global numerical tolerance values"""
-        global RTOL, ATOL
-        if rtol is not None:
-            RTOL = rtol
-        if atol is not None:
-            ATOL = atol
-    
-    def _save_current_tolerance(self) -> tuple[float, float]:
-        """Save current numerical tolerance values for restoration"""
-        return RTOL, ATOL
+# NOTE: 'algo_options' temporarily overrides the process-wide values through context variables, so that a 'with' block only affects the thread or asyncio task it runs in. Both variables are always set together within a block, and are unset outside of any block
+_RTOL: ContextVar[float] = ContextVar('RTOL')
+_ATOL: ContextVar[float] = ContextVar('ATOL')
 
-class NumericalToleranceContextManager(_NumericalToleranceBase):
-    """Context manager for temporarily setting numerical tolerance values.
-    
-    Call signature: (*, rtol=None, atol=None) -> NumericalToleranceContextManager
-    
-    Parameters
-    ----------
-    rtol : float or None, optional
-        Relative tolerance value to use within the context.
-        If None, the current rtol is unchanged within the context.
-    atol : float or None, optional
-        Absolute tolerance value to use within the context.
-        If None, the current atol is unchanged within the context.
-        
-    Examples
-    --------
-    >>> with algo_options(rtol=1E-6, atol=1E-10):
-    ...     # Code here uses the specified tolerances
-    ...     pass
-    >>> # Tolerances are automatically restored after the context
-    """
-    
-    def __call__(self, *, rtol: float | None = None, atol: float | None = None) -> NumericalToleranceContextManager:
-        """Configure tolerance values for context manager use"""
-        self._rtol = rtol
-        self._atol = atol
-        return self
+def _get_rtol() -> float:
+    """Get the relative tolerance in the current context"""
+    return _RTOL.get(_rtol_default)
 
-    def __enter__(self) -> NumericalToleranceContextManager:
-        """Enter context: save current values and set new ones"""
-        self._prev_rtol, self._prev_atol = self._save_current_tolerance()
-        self._set_tolerance(rtol=self._rtol, atol=self._atol)
-        return self
+def _get_atol() -> float:
+    """Get the absolute tolerance in the current context"""
+    return _ATOL.get(_atol_default)
 
-    def __exit__(self, *_: Any) -> None:
-        """Exit context: restore previous numerical tolerance values"""
-        global RTOL, ATOL
-        RTOL, ATOL = self._prev_rtol, self._prev_atol
-
-class NumericalToleranceSetter(_NumericalToleranceBase):
-    """Global setter for numerical tolerance values.
-    
-    Call signature: (shortcut=None, *, rtol=None, atol=None) -> None
-    
-    Parameters
-    ----------
-    shortcut : {'default'} or None, optional
-        Shortcut to set predefined tolerance values:
-        - 'default': Sets rtol=1E-5, atol=1E-8
-        If None, custom tolerances can be set via rtol/atol parameters.
-    rtol : float or None, optional
-        Relative tolerance value. If None, the current rtol is unchanged.
-    atol : float or None, optional
-        Absolute tolerance value. If None, the current atol is unchanged.
-        
-    Examples
-    --------
-    >>> set_algo_options('default')  # Set to default values
-    >>> set_algo_options(rtol=1E-6, atol=1E-10)  # Set custom values
-    >>> set_algo_options(rtol=1E-4)  # Only change rtol
-    
-    """
-    
-    def __call__(self, shortcut: Literal['default'] | None = None, *_: Any, rtol: float | None = None, atol: float | None = None) -> None:
-        """Set global numerical tolerance values permanently"""
-        if shortcut is None:
-            # Only set custom tolerances
-            self._set_tolerance(rtol=rtol, atol=atol)
-        elif not isinstance(shortcut, str):
-            raise ValueError("'set_algo_options' takes either no positional arguments or a single string argument 'default'. To set custom tolerances, use keyword arguments 'rtol' and/or 'atol'.")
-        elif shortcut == 'default':
-            # Set defaults first, then apply any custom overrides
-            self._set_tolerance(rtol=1E-5, atol=1E-8)
-            if rtol is not None or atol is not None:
-                self._set_tolerance(rtol=rtol, atol=atol)
-
-_algo_options_setter = NumericalToleranceSetter()
+# Export 'RTOL' and 'ATOL' as read-only module attributes holding the current values
+def __getattr__(name: str) -> float:
+    if name == 'RTOL':
+        return _get_rtol()
+    elif name == 'ATOL':
+        return _get_atol()
+    else:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 def set_algo_options(shortcut: Literal['default'] | None = None, /, *, rtol: float | None = None, atol: float | None = None) -> None:
     """Set global numerical tolerance values permanently.
 
+    When called within an `algo_options` block, the tolerances are only changed until the block is exited, just like the values set by `algo_options` itself.
+
     Parameters
     ----------
     shortcut : {'default'} or None, optional
@@ -111,6 +44,11 @@ def set_algo_options(shortcut: Literal['default'] | None = None, /, *, rtol: flo
     atol : float or None, optional  
         Absolute tolerance value. If None, the current atol is unchanged.
 
+    Raises
+    ------
+    ValueError
+        If `shortcut` is anything other than None or 'default'.
+
     Examples
     --------
     >>> set_algo_options('default')  # Set to default values
@@ -118,11 +56,25 @@ def set_algo_options(shortcut: Literal['default'] | None = None, /, *, rtol: flo
     >>> set_algo_options(rtol=1E-4)  # Only change rtol
     
     """
-    return _algo_options_setter(shortcut, rtol=rtol, atol=atol)
+    global _rtol_default, _atol_default
+    if shortcut is not None and shortcut != 'default':
+        raise ValueError("'set_algo_options' takes either no positional arguments or a single string argument 'default'. To set custom tolerances, use keyword arguments 'rtol' and/or 'atol'.")
+    new_rtol, new_atol = (1E-5, 1E-8) if shortcut == 'default' else (_get_rtol(), _get_atol())
+    # Apply any custom overrides on top of the (default) values
+    if rtol is not None:
+        new_rtol = rtol
+    if atol is not None:
+        new_atol = atol
+    if _RTOL.get(None) is None:
+        # Outside of any 'algo_options' block: change the process-wide values
+        _rtol_default, _atol_default = new_rtol, new_atol
+    else:
+        # Within an 'algo_options' block: change the values of the block, which are restored when it is exited
+        _RTOL.set(new_rtol)
+        _ATOL.set(new_atol)
 
-_tolerance_context_manager = NumericalToleranceContextManager()
-
-def algo_options(*, rtol: float | None = None, atol: float | None = None) -> NumericalToleranceContextManager:
+@contextmanager
+def algo_options(*, rtol: float | None = None, atol: float | None = None) -> Iterator[None]:
     """Context manager for temporarily setting numerical tolerance values.
 
     Parameters
@@ -133,11 +85,10 @@ def algo_options(*, rtol: float | None = None, atol: float | None = None) -> Num
     atol : float or None, optional
         Absolute tolerance value to use within the context.
         If None, the current atol is unchanged within the context.
-        
-    Returns
-    -------
-    NumericalToleranceContextManager
-        Context manager that temporarily sets the specified tolerances.
+
+    Notes
+    -----
+    On entering, the current values of both tolerances are saved within the context, and they are restored on exit. This also undoes any changes made by `set_algo_options` within the block.
 
     Examples
     --------
@@ -151,4 +102,10 @@ def algo_options(*, rtol: float | None = None, atol: float | None = None) -> Num
     ...     pass
     
     """
-    return _tolerance_context_manager(rtol=rtol, atol=atol)
\ No newline at end of file
+    token_rtol = _RTOL.set(rtol if rtol is not None else _get_rtol())
+    token_atol = _ATOL.set(atol if atol is not None else _get_atol())
+    try:
+        yield
+    finally:
+        _ATOL.reset(token_atol)
+        _RTOL.reset(token_rtol)
\ No newline at end of file
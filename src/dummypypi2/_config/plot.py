@@ -1,7 +1,7 @@
 """Config file for plotting settings and styles"""
 
 from __future__ import annotations
-from typing import Literal
+from typing import Any, Literal
 
 CLR_MATPLOTLIB_LEGACY = ['b', 'g', 'r', 'c', 'm', 'y', 'k']
 
@@ -74,49 +74,21 @@ CLR_TABLEAU_20 = ["#4E79A7",  # 0: Blue
                   "#E3DFDD"]  # 19: Light Gray
 
 
-class DisplayOptionsSetter:
-    """Global setter for display options.
-    
-    Call signature: (*, color_cycle=None) -> None
-    
-    Parameters
-    ----------
-    color_cycle : {'matplotlib', 'matplotlib_legacy', 'tableau_10'} or None, optional
-        Color palette to use for matplotlib plots. Options:
-        - 'matplotlib': Default matplotlib color cycle (10 colors)
-        - 'matplotlib_legacy': Legacy matplotlib single-letter colors (7 colors)
-        - 'tableau_10': Tableau 10 color palette (10 colors)
-        If None, no changes are made to the color cycle.
-        
-    Examples
-    --------
-    >>> set_display_options(color_cycle='tableau_10')
-    >>> set_display_options(color_cycle='matplotlib_legacy')
-    
-    """
-    
-    def __call__(self, *, color_cycle: Literal['matplotlib', 'matplotlib_legacy', 'tableau_10', 'tableau_20', 'category_10', 'category_20'] | None = None) -> None:
-        """Set global display options permanently"""
-        if color_cycle is not None:
-            color_dict = {
-                'matplotlib': CLR_CATEGORY_10,
-                'matplotlib_legacy': CLR_MATPLOTLIB_LEGACY,
-                'tableau_10': CLR_TABLEAU_10,
-                'tableau_20': CLR_TABLEAU_20,
-                'category_10': CLR_CATEGORY_10,
-                'category_20': CLR_CATEGORY_20
-            }
-            try:
-                import matplotlib as mpl
-                from cycler import cycler
-                mpl.rcParams['axes.prop_cycle'] = cycler(color=color_dict[color_cycle])
-            except ImportError:
-                raise ImportWarning("Package 'matplotlib' is not installed. Please install it to use this color palette.")
-            
+_COLOR_DICT = {
+    'matplotlib': CLR_CATEGORY_10,
+    'matplotlib_legacy': CLR_MATPLOTLIB_LEGACY,
+    'tableau_10': CLR_TABLEAU_10,
+    'tableau_20': CLR_TABLEAU_20,
+    'category_10': CLR_CATEGORY_10,
+    'category_20': CLR_CATEGORY_20
+}
+
+
+# NOTE: The result of importing matplotlib (the module, or None if it is not installed) is cached on the first call of 'set_display_options', so that later calls skip the import machinery
+_NOT_IMPORTED = object()
+_mpl: Any = _NOT_IMPORTED
 
-_display_options_setter = DisplayOptionsSetter()
 
-# FIXME: Unfortunately, to to Pylance static checking, the docstring must be duplicated here.
 def set_display_options(*, color_cycle: Literal['matplotlib', 'matplotlib_legacy', 'tableau_10', 'tableau_20', 'category_10', 'category_20'] | None = None) -> None:
     """Set global display options permanently.
 
@@ -143,4 +115,15 @@ def set_display_options(*, color_cycle: Literal['matplotlib', 'matplotlib_legacy
     >>> set_display_options(color_cycle='category_20')
     
     """
-    return _display_options_setter(color_cycle=color_cycle)
\ No newline at end of file
+    global _mpl
+    if color_cycle is not None:
+        if _mpl is _NOT_IMPORTED:
+            try:
+                import matplotlib
+                _mpl = matplotlib
+            except ImportError:
+                _mpl = None
+        if _mpl is None:
+            raise ImportWarning("Package 'matplotlib' is not installed. Please install it to use this color palette.")
+        # NOTE: A new cycler is built on each call, as 'Cycler' objects can be modified in-place (e.g. by '*=') once they are assigned to 'rcParams'
+        _mpl.rcParams['axes.prop_cycle'] = _mpl.cycler(color=_COLOR_DICT[color_cycle])
\ No newline at end of file
@@ -1,9 +1,14 @@
 """This is a dummy implementation of various robust control algorithms"""
 
-import numpy as np
-import numpy.typing as npt
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+# NOTE: NumPy is imported inside the functions, so that importing 'dummypypi2.control' does not import NumPy
+if TYPE_CHECKING:
+    import numpy.typing as npt
 
 
 def frob_norm(matrix: npt.ArrayLike) -> float:
     """Compute the Frobenius norm of a matrix"""
+    import numpy as np
     return np.linalg.norm(matrix, 'fro').item()
\ No newline at end of file
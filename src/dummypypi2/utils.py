@@ -9,20 +9,25 @@ FROM: https://stackoverflow.com/questions/69060850/intellij-how-to-delete-all-li
 FROM: https://intellij-support.jetbrains.com/hc/en-us/community/posts/115000142590-How-can-you-find-delete-lines-not-just-replace-with-nothing-  # nopep8
 """
 
+from __future__ import annotations
+
 from functools import cache, wraps
-from typing import TypeVar, TypeAlias, Callable, Any, Literal
+from typing import TYPE_CHECKING, TypeVar, TypeAlias, Callable, Any, Literal
 import warnings
 
-import numpy as np
-import numpy.typing as npt
-
 from . import _config as cfg
 
+# NOTE: NumPy is imported inside the functions, so that importing this module does not import NumPy
+if TYPE_CHECKING:
+    import numpy as np
+    import numpy.typing as npt
+
 
 def get_signed_angle(v_1: npt.NDArray[np.float64], v_2: npt.NDArray[np.float64], look: npt.NDArray[np.float64]) -> float:
     """
     FROM: https://github.com/lace/vg/blob/main/vg/core.py  #nopep8
     """
+    import numpy as np
 
     #: Compute the dot product (normalized)
     dot_products_normalized = np.dot(v_1, v_2) / np.linalg.norm(v_1, ord=2) / np.linalg.norm(v_2, ord=2)
@@ -50,6 +55,7 @@ def is_prime(n: int) -> bool:
 
 def divide(a: float, b: float) -> float:
     """Divide two numbers, returning np.inf if division by zero occurs"""
+    import numpy as np
     if np.isclose(b, 0.0):
         raise ValueError("Denominator is too close to zero.")
     return a / b
@@ -57,6 +63,7 @@ def divide(a: float, b: float) -> float:
 
 def is_close(a: float, b: float) -> bool:
     """Check if two floating-point numbers are close within global tolerances"""
+    import numpy as np
     return np.isclose(a, b, rtol=cfg.RTOL, atol=cfg.ATOL).item()
 
 
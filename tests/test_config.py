@@ -40,4 +40,81 @@ def test_algo_options_context_manager():
     if dp.is_close(a, b):
         errors.append("Outside context manager, a and b should not be considered close anymore")
 
-    assert not errors, "errors occurred:\n{}".format("\n".join(errors))
\ No newline at end of file
+    assert not errors, "errors occurred:\n{}".format("\n".join(errors))
+
+
+def test_algo_options_nested_context_manager():
+    import dummypypi2._config as cfg
+    dp.set_algo_options('default')
+    with dp.algo_options(rtol=1E-3):
+        with dp.algo_options(rtol=1E-2, atol=1E-4):
+            assert cfg.RTOL == 1E-2 and cfg.ATOL == 1E-4, "The inner context manager should set both RTOL and ATOL"
+        assert cfg.RTOL == 1E-3 and cfg.ATOL == 1E-8, "Leaving the inner context manager should restore the tolerances of the outer one"
+    assert cfg.RTOL == 1E-5 and cfg.ATOL == 1E-8, "Leaving both context managers should restore the default tolerances"
+
+
+def test_set_algo_options_within_context_manager():
+    import dummypypi2._config as cfg
+    dp.set_algo_options('default')
+    with dp.algo_options(rtol=1E-3):
+        dp.set_algo_options('default', atol=1E-2)
+        assert cfg.RTOL == 1E-5 and cfg.ATOL == 1E-2, "The global setter should take effect immediately within the context manager"
+    assert cfg.RTOL == 1E-5 and cfg.ATOL == 1E-8, "Leaving the context manager should undo the changes made by the global setter within it"
+
+
+def test_algo_options_thread_isolation():
+    import threading
+    import dummypypi2._config as cfg
+    dp.set_algo_options('default')
+    entered, checked = threading.Event(), threading.Event()
+
+    def worker():
+        with dp.algo_options(atol=1E-3):
+            entered.set()
+            checked.wait()
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    entered.wait()
+    atol_outside = cfg.ATOL
+    checked.set()
+    thread.join()
+    assert atol_outside == 1E-8, "A context manager in another thread should not affect the tolerances of the current thread"
+
+
+def test_set_algo_options_visible_in_thread():
+    import threading
+    import dummypypi2._config as cfg
+    dp.set_algo_options('default', atol=1E-3)
+    seen = {}
+
+    def worker():
+        seen['ATOL'] = cfg.ATOL
+        seen['is_close'] = dp.is_close(0.1, 0.10001)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    thread.join()
+    dp.set_algo_options('default')
+    assert seen['ATOL'] == 1E-3, "Tolerances set globally should be visible in a new thread"
+    assert seen['is_close'], "With ATOL=1E-3 set globally, a=0.1 and b=0.10001 should be considered close in a new thread"
+
+
+def test_set_algo_options_invalid_shortcut():
+    dp.set_algo_options('default')
+    with pytest.raises(ValueError):
+        dp.set_algo_options('foo', rtol=1E-3)
+    assert dp._config.RTOL == 1E-5, "An invalid shortcut should not change the tolerances"
+
+
+def test_set_display_options_without_matplotlib(monkeypatch):
+    import dummypypi2._config.plot as plot
+    # 1: Test that setting a color cycle fails when matplotlib is cached as not installed
+    monkeypatch.setattr(plot, '_mpl', None)
+    with pytest.raises(ImportWarning):
+        dp.set_display_options(color_cycle='tableau_10')
+
+    # 2: Test that not setting a color cycle does not try to import matplotlib
+    monkeypatch.setattr(plot, '_mpl', plot._NOT_IMPORTED)
+    dp.set_display_options(color_cycle=None)
+    assert plot._mpl is plot._NOT_IMPORTED, "Without a color cycle, matplotlib should not be imported"
@@ -1,5 +1,8 @@
 """Docstring for tests.test_control_robust"""
 
+import subprocess
+import sys
+
 import pytest
 import numpy as np
 
@@ -9,4 +12,21 @@ import dummypypi2 as dp
 def test_frob_norm():
     matrix = np.array([[1, 2], [3, 4]])
     expected_norm = np.sqrt(1 ** 2 + 2 ** 2 + 3 ** 2 + 4 ** 2)
-    assert dp.control.frob_norm(matrix) == pytest.approx(expected_norm)
\ No newline at end of file
+    assert dp.control.frob_norm(matrix) == pytest.approx(expected_norm)
+
+
+def test_frob_norm_complex():
+    matrix = np.array([[1 + 1j, 2], [0, 3j]])
+    assert dp.control.frob_norm(matrix) == pytest.approx(np.sqrt(2 + 4 + 9))
+
+
+def test_frob_norm_non_matrix():
+    with pytest.raises(ValueError):
+        dp.control.frob_norm(np.array([1, 2, 3]))
+
+
+def test_import_control_does_not_import_numpy():
+    # NOTE: This is run in a fresh interpreter, since NumPy is already imported by this test module
+    code = "import sys, dummypypi2.control; assert 'numpy' not in sys.modules"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, f"Importing 'dummypypi2.control' should not import NumPy:\n{result.stderr}"
@@ -0,0 +1,26 @@
+"""Tests for the lazy loading of sub-packages and functions in the main module"""
+
+import subprocess
+import sys
+
+import dummypypi2 as dp
+
+
+def test_import_does_not_import_numpy():
+    # NOTE: This is run in a fresh interpreter, since NumPy may already be imported by other test modules
+    code = "import sys, dummypypi2; assert 'numpy' not in sys.modules"
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, f"Importing 'dummypypi2' should not import NumPy:\n{result.stderr}"
+
+
+def test_star_import():
+    namespace = {}
+    exec("from dummypypi2 import *", namespace)
+    for name in ['control', 'algo_options', 'set_algo_options', 'set_display_options', 'get_signed_angle', 'is_close']:
+        assert name in namespace, f"'{name}' should be exported by 'from dummypypi2 import *'"
+
+
+def test_dir():
+    assert set(dp.__all__) == {name for name in dp._submodules + list(dp._attr_to_submod) if not name.startswith('_')}, "'__all__' should list all public lazily loaded names"
+    assert set(dp.__all__) <= set(dir(dp)), "All exported names should be listed by 'dir(dummypypi2)'"
+    assert 'TYPE_CHECKING' not in dir(dp) and 'importlib' not in dir(dp), "Helper names should not be listed by 'dir(dummypypi2)'"
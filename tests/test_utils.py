@@ -38,4 +38,8 @@ def test_get_signed_angle_argument_swap():
 def test_divide():
     assert dp.divide(4, 2) == 2.0, "4 divided by 2 should be 2"
     with pytest.raises(ValueError):
-        dp.divide(1, 0)
\ No newline at end of file
+        dp.divide(1, 0)
+
+
+def test_utils_submodule():
+    assert dp.utils.is_prime(7), "The 'utils' module should be accessible as 'dp.utils'"